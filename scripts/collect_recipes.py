@@ -6,6 +6,7 @@ Collects highly-rated recipes from popular sites and saves as organized JSON.
 
 import json
 import re
+import sys
 import time
 import os
 from datetime import datetime
@@ -14,6 +15,8 @@ import requests
 from dataclasses import dataclass, asdict
 from typing import Optional
 
+from related_recipes import build_related, save_related_json
+
 # Configuration
 OUTPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "recipe-data")
 DELAY_BETWEEN_REQUESTS = 3  # seconds
@@ -311,8 +314,10 @@ CURATED_RECIPES = {
 }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Recipe:
+    # Slotted, immutable and tuple-backed so large crawls stay compact in
+    # memory; tuples serialize to the same JSON arrays as lists.
     id: str
     slug: str
     title: str
@@ -321,9 +326,9 @@ class Recipe:
     cookTime: Optional[str]
     totalTime: Optional[str]
     servings: Optional[str]
-    ingredients: list
-    instructions: list
-    tags: list
+    ingredients: tuple
+    instructions: tuple
+    tags: tuple
     source: dict
     theme: str
     difficulty: str
@@ -339,6 +344,13 @@ def slugify(text: str) -> str:
     return text
 
 
+def intern_text(text: Optional[str]) -> Optional[str]:
+    """Intern a frequently repeated string so equal values share one object."""
+    if not text:
+        return text
+    return sys.intern(text)
+
+
 def decode_html_entities(text: str) -> str:
     """Decode HTML entities in text."""
     if not text:
@@ -490,10 +502,10 @@ def fetch_recipe(url: str, theme_slug: str, theme_name: str, difficulty: str = "
         title = decode_html_entities(recipe_data.get('name', 'Untitled'))
         ingredients = recipe_data.get('recipeIngredient', [])
         if isinstance(ingredients, list):
-            ingredients = [decode_html_entities(i) for i in ingredients if i]
+            ingredients = tuple(decode_html_entities(i) for i in ingredients if i)
 
         instructions = parse_instructions(recipe_data.get('recipeInstructions', []))
-        instructions = [decode_html_entities(i) for i in instructions if i]
+        instructions = tuple(decode_html_entities(i) for i in instructions if i)
 
         if not ingredients and not instructions:
             print(f"    ⚠ Recipe incomplete (no ingredients or instructions)")
@@ -539,11 +551,11 @@ def fetch_recipe(url: str, theme_slug: str, theme_name: str, difficulty: str = "
             tags.append('pasta')
 
         # Dedupe tags
-        tags = list(dict.fromkeys(tags))[:8]
+        tags = tuple(intern_text(tag) for tag in dict.fromkeys(tags))[:8]
 
         # Get source info
         parsed_url = urlparse(url)
-        source_name = parsed_url.netloc.replace('www.', '').split('.')[0].title()
+        source_name = intern_text(parsed_url.netloc.replace('www.', '').split('.')[0].title())
 
         # Get image
         image_url = parse_image(recipe_data.get('image'))
@@ -553,16 +565,16 @@ def fetch_recipe(url: str, theme_slug: str, theme_name: str, difficulty: str = "
             slug=slug,
             title=title,
             image=image_url,
-            prepTime=prep_time,
-            cookTime=cook_time,
-            totalTime=total_time,
-            servings=servings,
+            prepTime=intern_text(prep_time),
+            cookTime=intern_text(cook_time),
+            totalTime=intern_text(total_time),
+            servings=intern_text(servings),
             ingredients=ingredients,
             instructions=instructions,
             tags=tags,
             source={"name": source_name, "url": url},
-            theme=theme_name,
-            difficulty=difficulty,
+            theme=intern_text(theme_name),
+            difficulty=intern_text(difficulty),
             addedDate=datetime.utcnow().isoformat() + "Z"
         )
 
@@ -626,12 +638,14 @@ def save_theme_json(theme_slug: str, theme_config: dict, recipes: list):
             "recipeCount": len(recipes),
             "lastUpdated": datetime.utcnow().isoformat() + "Z",
         },
-        "recipes": [asdict(r) for r in recipes]
+        "recipes": recipes
     }
 
     filepath = os.path.join(OUTPUT_DIR, f"{theme_slug}.json")
     with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+        # Recipes are converted one at a time while encoding instead of
+        # materializing a dict copy of every recipe up front.
+        json.dump(output, f, indent=2, ensure_ascii=False, default=asdict)
 
     print(f"  💾 Saved to {filepath}")
 
@@ -659,12 +673,12 @@ def save_master_json(all_recipes: dict):
             "lastUpdated": datetime.utcnow().isoformat() + "Z",
         },
         "collections": collections,
-        "recipes": [asdict(r) for r in all_recipes_flat]
+        "recipes": all_recipes_flat
     }
 
     filepath = os.path.join(OUTPUT_DIR, "all-recipes.json")
     with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+        json.dump(output, f, indent=2, ensure_ascii=False, default=asdict)
 
     print(f"\n💾 Master file saved to {filepath}")
 
@@ -696,6 +710,10 @@ def main():
     # Save master file
     save_master_json(all_recipes)
 
+    # Precompute related recipes for every collected slug
+    related = build_related(r for data in all_recipes.values() for r in data['recipes'])
+    save_related_json(related, OUTPUT_DIR)
+
     # Print summary
     print("\n" + "="*60)
     print("📊 COLLECTION COMPLETE")
@@ -706,6 +724,7 @@ def main():
     for theme_slug in THEMES:
         print(f"  • {theme_slug}.json")
     print(f"  • all-recipes.json (master index)")
+    print(f"  • related.json (related recipes)")
     print("\n✅ Done!")
 
 
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Local Stand-in Recipe Server for Simpler Recipes
+Serves synthetic recipe pages for offline load and regression testing of
+collect_recipes.py, and can run the full collector pipeline against them.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import resource
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import collect_recipes
+
+# Configuration
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_PAGE_KB = 64  # filler markup per page, roughly a real recipe page
+
+INGREDIENTS = [
+    "chicken thighs", "olive oil", "garlic", "yellow onion", "kosher salt",
+    "black pepper", "unsalted butter", "all-purpose flour", "brown sugar",
+    "eggs", "whole milk", "basmati rice", "canned tomatoes", "fresh basil",
+    "ground beef", "soy sauce", "fresh ginger", "lemon juice", "parmesan",
+    "spaghetti", "chickpeas", "coconut milk", "baby spinach", "cumin",
+]
+DISHES = [
+    "Stir Fry", "Pasta", "Soup", "Curry", "Tacos", "Salad", "Casserole",
+    "Skillet", "Bowl", "Stew", "Bake", "Risotto",
+]
+SITE_NAMES = ["Budget Bytes", "RecipeTin Eats", "Cookie and Kate", "AllRecipes"]
+
+
+class StandinConfig:
+    """Behaviour of the stand-in server, shared by all request handlers."""
+
+    def __init__(self, page_kb: int = DEFAULT_PAGE_KB, latency_ms: float = 0,
+                 error_rate: float = 0, rate_limit_rate: float = 0,
+                 graph_rate: float = 0.5, seed: int = 0):
+        self.page_kb = page_kb
+        self.latency_ms = latency_ms
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.graph_rate = graph_rate
+        self.seed = seed
+        self.responses = Counter()
+        self.lock = threading.Lock()
+
+    def record(self, status: int):
+        with self.lock:
+            self.responses[status] += 1
+
+
+def recipe_schema(index: int) -> dict:
+    """Build a deterministic schema.org Recipe for a page index."""
+    rng = random.Random(index)
+    main = rng.choice(INGREDIENTS)
+    ingredients = [
+        f"{rng.randint(1, 4)} {rng.choice(['cups', 'tbsp', 'tsp', 'oz'])} {ingredient}"
+        for ingredient in rng.sample(INGREDIENTS, rng.randint(6, 14))
+    ]
+    steps = [
+        {"@type": "HowToStep", "text": f"Add the {rng.choice(INGREDIENTS)} and cook for {rng.randint(2, 15)} minutes."}
+        for _ in range(rng.randint(4, 10))
+    ]
+
+    return {
+        "@type": "Recipe",
+        "name": f"{main.title()} {rng.choice(DISHES)} No. {index}",
+        "image": {"@type": "ImageObject", "url": f"https://images.example.com/{index}.jpg"},
+        "prepTime": f"PT{rng.choice([5, 10, 15, 20])}M",
+        "cookTime": f"PT{rng.choice([0, 1])}H{rng.choice([10, 20, 30, 45])}M",
+        "recipeYield": [f"{rng.randint(2, 8)}", f"{rng.randint(2, 8)} servings"],
+        "recipeIngredient": ingredients,
+        "recipeInstructions": steps,
+    }
+
+
+def render_page(index: int, config: StandinConfig) -> str:
+    """Render an HTML recipe page, using an @graph layout for some pages."""
+    rng = random.Random(f"{config.seed}:layout:{index}")
+    recipe = recipe_schema(index)
+
+    if rng.random() < config.graph_rate:
+        data = {
+            "@context": "https://schema.org",
+            "@graph": [
+                {"@type": "Organization", "name": SITE_NAMES[index % len(SITE_NAMES)]},
+                {"@type": "WebPage", "name": recipe["name"]},
+                recipe,
+            ],
+        }
+    else:
+        data = {"@context": "https://schema.org", **recipe}
+
+    filler = "<p>Lorem ipsum dolor sit amet, consectetur adipiscing elit.</p>\n"
+    padding = filler * (config.page_kb * 1024 // len(filler))
+
+    return (
+        "<!DOCTYPE html>\n<html><head>\n"
+        f"<title>{recipe['name']}</title>\n"
+        '<script type="application/ld+json">{"@context":"https://schema.org","@type":"BreadcrumbList"}</script>\n'
+        f'<script type="application/ld+json">{json.dumps(data)}</script>\n'
+        f"</head><body>\n{padding}</body></html>\n"
+    )
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    """Serve /recipes/<index>/ pages with injected latency and failures."""
+
+    config = None
+
+    def do_GET(self):
+        config = self.config
+        if config.latency_ms:
+            time.sleep(config.latency_ms / 1000)
+
+        parts = self.path.strip('/').split('/')
+        if len(parts) != 2 or parts[0] != 'recipes' or not parts[1].isdigit():
+            self.respond(404, "Not Found")
+            return
+
+        index = int(parts[1])
+        rng = random.Random(f"{config.seed}:status:{index}")
+        roll = rng.random()
+        if roll < config.rate_limit_rate:
+            self.respond(429, "Too Many Requests", {"Retry-After": "1"})
+        elif roll < config.rate_limit_rate + config.error_rate:
+            self.respond(500, "Internal Server Error")
+        else:
+            self.respond(200, render_page(index, config))
+
+    def respond(self, status: int, body: str, headers: dict = None):
+        payload = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+        self.config.record(status)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(config: StandinConfig, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> ThreadingHTTPServer:
+    """Start the stand-in server on a background thread."""
+    handler = type("ConfiguredStandinHandler", (StandinHandler,), {"config": config})
+    server = ThreadingHTTPServer((host, port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def run_load(config: StandinConfig, url_count: int, host: str, port: int,
+             output_dir: str = None, verbose: bool = False):
+    """Run collect_recipes.main() against the stand-in server and report."""
+    server = start_server(config, host, port)
+    base_url = f"http://{host}:{server.server_address[1]}"
+    output_dir = output_dir or tempfile.mkdtemp(prefix="standin-recipes-")
+
+    # Spread the URLs over the real themes, in the collector's curated format
+    themes = {}
+    curated = {}
+    theme_slugs = list(collect_recipes.THEMES)
+    for position, theme_slug in enumerate(theme_slugs):
+        indexes = range(position, url_count, len(theme_slugs))
+        themes[theme_slug] = {**collect_recipes.THEMES[theme_slug], "count": len(indexes)}
+        curated[theme_slug] = [
+            (f"Stand-in {i}", f"{base_url}/recipes/{i}/", "Stand-in", "30 min", "Easy")
+            for i in indexes
+        ]
+
+    collect_recipes.THEMES = themes
+    collect_recipes.CURATED_RECIPES = curated
+    collect_recipes.OUTPUT_DIR = output_dir
+    collect_recipes.DELAY_BETWEEN_REQUESTS = 0
+
+    print(f"🧪 Collecting {url_count} URLs from {base_url} into {output_dir}")
+    start = time.perf_counter()
+    log = None if verbose else io.StringIO()
+    with contextlib.redirect_stdout(log) if log else contextlib.nullcontext():
+        collect_recipes.main()
+    elapsed = time.perf_counter() - start
+    server.shutdown()
+
+    with open(os.path.join(output_dir, "all-recipes.json"), encoding='utf-8') as f:
+        collected = json.load(f)['metadata']['totalRecipes']
+
+    responses = config.responses
+    failed_responses = sum(count for status, count in responses.items() if status != 200)
+    unexpected = url_count - collected - failed_responses
+
+    print("\n" + "="*60)
+    print("📊 LOAD RUN COMPLETE")
+    print("="*60)
+    print(f"URLs requested:       {url_count}")
+    print(f"Recipes collected:    {collected}")
+    print(f"Server responses:     " + ", ".join(f"{status}={count}" for status, count in sorted(responses.items())))
+    print(f"Failed as expected:   {failed_responses}")
+    print(f"Unexpected failures:  {unexpected}")
+    print(f"Elapsed:              {elapsed:.1f}s")
+    print(f"Throughput:           {collected / elapsed:.1f} recipes/sec ({url_count / elapsed:.1f} URLs/sec)")
+    print(f"Peak RSS:             {peak_rss_mb():.0f} MB")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("mode", choices=["serve", "load"],
+                        help="serve pages until interrupted, or run the collector against them")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="0 picks a free port")
+    parser.add_argument("--urls", type=int, default=2000, help="URLs to collect in load mode")
+    parser.add_argument("--page-kb", type=int, default=DEFAULT_PAGE_KB, help="filler markup per page")
+    parser.add_argument("--latency-ms", type=float, default=0, help="delay before every response")
+    parser.add_argument("--error-rate", type=float, default=0, help="fraction of pages returning 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0, help="fraction of pages returning 429")
+    parser.add_argument("--graph-rate", type=float, default=0.5, help="fraction of pages using an @graph layout")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output-dir", help="where load mode writes JSON (default: a temp dir)")
+    parser.add_argument("--verbose", action="store_true", help="show the collector's own output")
+    args = parser.parse_args()
+
+    config = StandinConfig(
+        page_kb=args.page_kb,
+        latency_ms=args.latency_ms,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        graph_rate=args.graph_rate,
+        seed=args.seed,
+    )
+
+    if args.mode == "load":
+        run_load(config, args.urls, args.host, args.port, args.output_dir, args.verbose)
+        return
+
+    server = start_server(config, args.host, args.port)
+    print(f"🍳 Serving stand-in recipes at http://{args.host}:{server.server_address[1]}/recipes/<n>/")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
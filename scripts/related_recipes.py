@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Related Recipes Builder for Simpler Recipes
+Precomputes the top-k most similar recipes per slug from TF-IDF vectors over
+ingredients, tags and title, and saves them as a compact related.json.
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import time
+
+import numpy as np
+from scipy import sparse
+
+# Configuration
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "recipe-data")
+RELATED_COUNT = 6
+BLOCK_SIZE = 128  # rows scored per sparse matrix product
+
+# Feature weights per field, applied before normalization
+TITLE_WEIGHT = 2.0
+TAG_WEIGHT = 1.0
+INGREDIENT_WEIGHT = 1.0
+
+# Words in ingredient lines that say nothing about the dish itself
+INGREDIENT_STOPWORDS = {
+    "and", "or", "of", "to", "for", "the", "a", "an", "with", "into", "plus",
+    "cup", "cups", "tablespoon", "tablespoons", "tbsp", "teaspoon", "teaspoons",
+    "tsp", "ounce", "ounces", "oz", "pound", "pounds", "lb", "lbs", "gram",
+    "grams", "kg", "ml", "liter", "liters", "pinch", "dash", "can", "cans",
+    "package", "packages", "clove", "cloves", "slice", "slices", "large",
+    "medium", "small", "chopped", "diced", "minced", "sliced", "fresh",
+    "freshly", "ground", "divided", "optional", "taste", "needed", "about",
+    "finely", "roughly", "thinly", "peeled", "softened", "melted", "room",
+    "temperature", "whole", "cut", "pieces", "inch", "more",
+}
+
+WORD_PATTERN = re.compile(r"[a-z]+")
+
+
+def tokenize(text: str) -> list:
+    """Split text into lowercase alphabetic words."""
+    return WORD_PATTERN.findall(text.lower()) if text else []
+
+
+def recipe_features(title: str, ingredients, tags) -> dict:
+    """Build weighted term counts for a recipe, namespaced by field."""
+    features = {}
+
+    def add(term, weight):
+        features[term] = features.get(term, 0.0) + weight
+
+    for word in tokenize(title):
+        if len(word) > 2:
+            add(f"t:{word}", TITLE_WEIGHT)
+    for tag in tags or []:
+        add(f"g:{tag.lower()}", TAG_WEIGHT)
+    for line in ingredients or []:
+        for word in tokenize(line):
+            if len(word) > 2 and word not in INGREDIENT_STOPWORDS:
+                add(f"i:{word}", INGREDIENT_WEIGHT)
+
+    return features
+
+
+def tfidf_matrix(documents: list) -> sparse.csr_matrix:
+    """Build an L2-normalized TF-IDF matrix (one row per document)."""
+    vocabulary = {}
+    indptr = [0]
+    indices = []
+    values = []
+
+    for features in documents:
+        for term, count in features.items():
+            indices.append(vocabulary.setdefault(term, len(vocabulary)))
+            values.append(count)
+        indptr.append(len(indices))
+
+    matrix = sparse.csr_matrix(
+        (np.asarray(values, dtype=np.float32),
+         np.asarray(indices, dtype=np.int32),
+         np.asarray(indptr, dtype=np.int64)),
+        shape=(len(documents), len(vocabulary)),
+    )
+
+    # Sublinear term frequency and smoothed inverse document frequency
+    np.log1p(matrix.data, out=matrix.data)
+    document_frequency = np.bincount(matrix.indices, minlength=len(vocabulary))
+    idf = np.log((1 + len(documents)) / (1 + document_frequency)) + 1
+    matrix = matrix.multiply(idf.astype(np.float32)).tocsr()
+
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    return sparse.diags((1 / norms).astype(np.float32)) @ matrix
+
+
+def top_k_similar(matrix: sparse.csr_matrix, top_k: int = RELATED_COUNT) -> tuple:
+    """
+    Find the top-k most similar rows for every row by cosine similarity.
+    Returns (indices, scores) arrays of shape (rows, top_k), best first.
+    """
+    rows = matrix.shape[0]
+    top_k = min(top_k, max(rows - 1, 0))
+    indices = np.zeros((rows, top_k), dtype=np.int64)
+    scores = np.zeros((rows, top_k), dtype=np.float32)
+    if not top_k:
+        return indices, scores
+
+    for start in range(0, rows, BLOCK_SIZE):
+        stop = min(start + BLOCK_SIZE, rows)
+        # Sparse-times-dense is far cheaper than a sparse-times-sparse product
+        # here, since every block of similarities is nearly dense anyway
+        block = np.ascontiguousarray((matrix @ matrix[start:stop].T.toarray()).T)
+
+        # A recipe is never related to itself
+        block[np.arange(stop - start), np.arange(start, stop)] = -1
+
+        candidates = np.argpartition(block, -top_k, axis=1)[:, -top_k:]
+        candidate_scores = np.take_along_axis(block, candidates, axis=1)
+        order = np.argsort(-candidate_scores, axis=1, kind="stable")
+        indices[start:stop] = np.take_along_axis(candidates, order, axis=1)
+        scores[start:stop] = np.take_along_axis(candidate_scores, order, axis=1)
+
+    return indices, scores
+
+
+def build_related(recipes, top_k: int = RELATED_COUNT) -> dict:
+    """
+    Map each recipe slug to the slugs of its most similar recipes.
+    Accepts recipe dicts or objects with slug, title, ingredients and tags.
+    """
+    unique = {}
+    for recipe in recipes:
+        if isinstance(recipe, dict):
+            slug, title = recipe['slug'], recipe.get('title', '')
+            ingredients, tags = recipe.get('ingredients'), recipe.get('tags')
+        else:
+            slug, title = recipe.slug, recipe.title
+            ingredients, tags = recipe.ingredients, recipe.tags
+        # Recipes shared between themes are only scored once
+        if slug not in unique:
+            unique[slug] = recipe_features(title, ingredients, tags)
+
+    slugs = list(unique)
+    if not slugs:
+        return {}
+
+    indices, scores = top_k_similar(tfidf_matrix(list(unique.values())), top_k)
+
+    related = {}
+    for row, slug in enumerate(slugs):
+        related[slug] = [slugs[i] for i, score in zip(indices[row], scores[row]) if score > 0]
+    return related
+
+
+def save_related_json(related: dict, output_dir: str = DATA_DIR):
+    """Save related recipe slugs as compact JSON."""
+    filepath = os.path.join(output_dir, "related.json")
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(related, f, ensure_ascii=False, separators=(',', ':'))
+
+    print(f"💾 Related recipes saved to {filepath}")
+
+
+def synthetic_recipes(count: int, seed: int = 0) -> list:
+    """Generate a synthetic recipe corpus for benchmarking."""
+    rng = random.Random(seed)
+
+    def word():
+        return ''.join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(4, 9)))
+
+    vocabulary = [word() for _ in range(2000)]
+    dishes = [word() for _ in range(300)]
+    tags = [word() for _ in range(60)]
+    common = ["salt", "pepper", "olive oil", "garlic", "onion", "butter"]
+
+    recipes = []
+    for i in range(count):
+        ingredients = [f"1 cup {rng.choice(vocabulary)}" for _ in range(rng.randint(5, 12))]
+        ingredients += rng.sample(common, 3)
+        recipes.append({
+            "slug": f"recipe-{i}",
+            "title": f"{rng.choice(dishes)} with {rng.choice(vocabulary)}",
+            "ingredients": ingredients,
+            "tags": rng.sample(tags, 4),
+        })
+    return recipes
+
+
+def run_benchmark(sizes: list, top_k: int):
+    """Print build time for growing synthetic corpora."""
+    print(f"{'recipes':>10} {'seconds':>10} {'recipes/s':>12}")
+    for size in sizes:
+        recipes = synthetic_recipes(size)
+        start = time.perf_counter()
+        build_related(recipes, top_k)
+        elapsed = time.perf_counter() - start
+        print(f"{size:>10} {elapsed:>10.2f} {size / elapsed:>12.0f}")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--top-k", type=int, default=RELATED_COUNT,
+                        help="related recipes kept per slug")
+    parser.add_argument("--benchmark", type=int, nargs="*", metavar="SIZE",
+                        help="time builds over synthetic corpora of these sizes")
+    args = parser.parse_args()
+
+    if args.benchmark is not None:
+        run_benchmark(args.benchmark or [1000, 5000, 10000, 25000, 50000], args.top_k)
+        return
+
+    with open(os.path.join(DATA_DIR, "all-recipes.json"), encoding='utf-8') as f:
+        recipes = json.load(f)['recipes']
+
+    related = build_related(recipes, args.top_k)
+    print(f"🔗 Related recipes computed for {len(related)} recipes")
+    save_related_json(related)
+
+
+if __name__ == "__main__":
+    main()